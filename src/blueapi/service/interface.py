@@ -89,12 +89,20 @@ def setup(config: ApplicationConfig) -> None:
 
 
 def teardown() -> None:
-    worker().stop()
-    if (stomp_client_ref := stomp_client()) is not None:
+    # Only tear down what was actually created, rather than building a worker
+    # and messaging connection just to stop them again
+    if worker.cache_info().currsize > 0:
+        worker().stop()
+    if (
+        stomp_client.cache_info().currsize > 0
+        and (stomp_client_ref := stomp_client()) is not None
+    ):
         stomp_client_ref.disconnect()
     context.cache_clear()
     worker.cache_clear()
     stomp_client.cache_clear()
+    _plan_models.cache_clear()
+    _device_models.cache_clear()
 
 
 def _publish_event_streams(
@@ -114,24 +122,40 @@ def _publish_event_stream(stream: EventStream, destination: DestinationBase) ->
     stream.subscribe(forward_message)
 
 
+@cache
+def _plan_models() -> dict[str, PlanModel]:
+    # Plans are registered when the context is created and do not change until
+    # teardown, so the models and their schemas are only built once per context.
+    # Callers are given deep copies so they cannot modify the cached models
+    return {name: PlanModel.from_plan(plan) for name, plan in context().plans.items()}
+
+
+@cache
+def _device_models() -> dict[str, DeviceModel]:
+    return {
+        name: DeviceModel.from_device(device)
+        for name, device in context().devices.items()
+    }
+
+
 def get_plans() -> list[PlanModel]:
     """Get all available plans in the BlueskyContext"""
-    return [PlanModel.from_plan(plan) for plan in context().plans.values()]
+    return [model.model_copy(deep=True) for model in _plan_models().values()]
 
 
 def get_plan(name: str) -> PlanModel:
     """Get plan by name from the BlueskyContext"""
-    return PlanModel.from_plan(context().plans[name])
+    return _plan_models()[name].model_copy(deep=True)
 
 
 def get_devices() -> list[DeviceModel]:
     """Get all available devices in the BlueskyContext"""
-    return [DeviceModel.from_device(device) for device in context().devices.values()]
+    return [model.model_copy(deep=True) for model in _device_models().values()]
 
 
 def get_device(name: str) -> DeviceModel:
     """Retrieve device by name from the BlueskyContext"""
-    return DeviceModel.from_device(context().devices[name])
+    return _device_models()[name].model_copy(deep=True)
 
 
 def submit_task(task: Task) -> str:
@@ -382,7 +382,7 @@ class TaskWorker:
             old_state = WorkerState.from_bluesky_state(raw_old_state)
         else:
             old_state = WorkerState.UNKNOWN
-        LOGGER.debug(f"Notifying state change {old_state} -> {new_state}")
+        LOGGER.debug("Notifying state change %s -> %s", old_state, new_state)
         self._state = new_state
         self._report_status()
 
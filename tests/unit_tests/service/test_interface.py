@@ -1,5 +1,7 @@
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 from unittest.mock import ANY, MagicMock, Mock, patch
 
 import pytest
@@ -39,22 +41,33 @@ def ensure_worker_stopped():
     interface.teardown()
 
 
+@pytest.fixture(scope="module")
+def shared_context() -> BlueskyContext:
+    """Context for tests that only read its plans and devices, built once per
+    module rather than per test"""
+    context = BlueskyContext()
+    context.register_plan(my_plan)
+    context.register_plan(my_second_plan)
+    context.register_device(MyDevice(name="my_device"))
+    context.register_device(SynAxis(name="my_axis"))
+    return context
+
+
 def my_plan() -> MsgGenerator:
     """My plan does cool stuff."""
-    yield from {}
+    return
+    yield
 
 
 def my_second_plan(repeats: int) -> MsgGenerator:
     """Plan B."""
-    yield from {}
+    return
+    yield
 
 
 @patch("blueapi.service.interface.context")
-def test_get_plans(context_mock: MagicMock):
-    context = BlueskyContext()
-    context.register_plan(my_plan)
-    context.register_plan(my_second_plan)
-    context_mock.return_value = context
+def test_get_plans(context_mock: MagicMock, shared_context: BlueskyContext):
+    context_mock.return_value = shared_context
 
     assert interface.get_plans() == [
         PlanModel(
@@ -82,11 +95,8 @@ def test_get_plans(context_mock: MagicMock):
 
 
 @patch("blueapi.service.interface.context")
-def test_get_plan(context_mock: MagicMock):
-    context = BlueskyContext()
-    context.register_plan(my_plan)
-    context.register_plan(my_second_plan)
-    context_mock.return_value = context
+def test_get_plan(context_mock: MagicMock, shared_context: BlueskyContext):
+    context_mock.return_value = shared_context
 
     assert interface.get_plan("my_plan") == PlanModel(
         name="my_plan",
@@ -109,11 +119,8 @@ class MyDevice:
 
 
 @patch("blueapi.service.interface.context")
-def test_get_devices(context_mock: MagicMock):
-    context = BlueskyContext()
-    context.register_device(MyDevice(name="my_device"))
-    context.register_device(SynAxis(name="my_axis"))
-    context_mock.return_value = context
+def test_get_devices(context_mock: MagicMock, shared_context: BlueskyContext):
+    context_mock.return_value = shared_context
 
     assert interface.get_devices() == [
         DeviceModel(name="my_device", protocols=["HasName"]),
@@ -137,12 +144,31 @@ def test_get_devices(context_mock: MagicMock):
     ]
 
 
+class MaybeReadableDevice:
+    def __init__(self, name: str, readable: bool) -> None:
+        self.name = name
+        if readable:
+            self.read = MagicMock()
+            self.describe = MagicMock()
+
+
 @patch("blueapi.service.interface.context")
-def test_get_device(context_mock: MagicMock):
+def test_get_devices_checks_protocols_per_device(context_mock: MagicMock):
     context = BlueskyContext()
-    context.register_device(MyDevice(name="my_device"))
+    context.register_device(MaybeReadableDevice("plain", readable=False))
+    context.register_device(MaybeReadableDevice("readable", readable=True))
     context_mock.return_value = context
 
+    assert interface.get_devices() == [
+        DeviceModel(name="plain", protocols=["HasName"]),
+        DeviceModel(name="readable", protocols=["HasName", "Readable"]),
+    ]
+
+
+@patch("blueapi.service.interface.context")
+def test_get_device(context_mock: MagicMock, shared_context: BlueskyContext):
+    context_mock.return_value = shared_context
+
     assert interface.get_device("my_device") == DeviceModel(
         name="my_device", protocols=["HasName"]
     )
@@ -151,6 +177,47 @@ def test_get_device(context_mock: MagicMock):
         assert interface.get_device("non_existing_device")
 
 
+@pytest.mark.parametrize(
+    "get_all, get_one, name",
+    [
+        (interface.get_plans, interface.get_plan, "my_plan"),
+        (interface.get_devices, interface.get_device, "my_device"),
+    ],
+)
+@patch("blueapi.service.interface.context")
+def test_models_built_once_per_context(
+    context_mock: MagicMock,
+    shared_context: BlueskyContext,
+    get_all: Callable[[], list[Any]],
+    get_one: Callable[[str], Any],
+    name: str,
+):
+    context_mock.return_value = shared_context
+
+    assert get_all() == get_all()
+    assert get_one(name) == get_one(name)
+    context_mock.assert_called_once()
+
+
+@patch("blueapi.service.interface.context")
+def test_returned_models_do_not_share_cached_state(
+    context_mock: MagicMock, shared_context: BlueskyContext
+):
+    context_mock.return_value = shared_context
+
+    for plan in [interface.get_plans()[0], interface.get_plan("my_plan")]:
+        assert plan.parameter_schema is not None
+        plan.parameter_schema["title"] = "changed"
+    interface.get_devices()[0].protocols.append("Changed")
+    interface.get_device("my_device").protocols.clear()
+
+    for plan in [interface.get_plans()[0], interface.get_plan("my_plan")]:
+        assert plan.parameter_schema is not None
+        assert plan.parameter_schema["title"] == "my_plan"
+    assert interface.get_devices()[0].protocols == ["HasName"]
+    assert interface.get_device("my_device").protocols == ["HasName"]
+
+
 @patch("blueapi.service.interface.context")
 def test_submit_task(context_mock: MagicMock):
     context = BlueskyContext()
@@ -284,6 +351,16 @@ def test_get_task_by_id(context_mock: MagicMock):
     )
 
 
+@patch("blueapi.service.interface.TaskWorker")
+@patch("blueapi.service.interface.context")
+def test_teardown_does_not_create_worker(
+    context_mock: MagicMock, worker_mock: MagicMock
+):
+    interface.teardown()
+    context_mock.assert_not_called()
+    worker_mock.assert_not_called()
+
+
 def test_get_oidc_config(oidc_config: OIDCConfig):
     interface.set_config(ApplicationConfig(oidc=oidc_config))
     assert interface.get_oidc_config() == oidc_config